@@ -1,12 +1,24 @@
 
 import streamlit as st
 import pandas as pd
-import json
+import io
+import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 from datetime import datetime, date
 import os
-from typing import Dict, List, Any
+import bisect
+import functools
+import logging
+import threading
+from typing import Dict, List, Tuple, Any
 import uuid
 
+logger = logging.getLogger(__name__)
+
 # Page configuration
 st.set_page_config(
     page_title="Thrift Savings Management",
@@ -15,53 +27,391 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Precompiled rupee formatter shared by every metric and table
+_CURRENCY = "₹{:,.2f}".format
+
+# Journal size in bytes past which appended transactions are compacted into the store
+JOURNAL_COMPACT_BYTES = 1_000_000
+
+# Member count above which search scans a numpy array instead of a Python list
+NUMPY_SEARCH_THRESHOLD = 10000
+
+# Column layout of the transactions table in the Parquet working store
+TRANSACTION_SCHEMA = pa.schema([
+    ("MemberID", pa.string()),
+    ("Date", pa.string()),
+    ("Recovery", pa.float64()),
+    ("ReceiptNumber", pa.string()),
+    ("Paid", pa.float64()),
+    ("Balance", pa.float64()),
+    ("DaysHeld", pa.int64()),
+    ("InterestRate", pa.float64()),
+    ("InterestAmount", pa.float64()),
+    ("TransactionType", pa.string()),
+    ("InterestBand", pa.string()),
+])
+
+# Columns of a member's ThriftRecords, i.e. the transactions table without MemberID
+RECORD_SCHEMA = TRANSACTION_SCHEMA.remove(TRANSACTION_SCHEMA.get_field_index("MemberID"))
+
+# Python type each transaction field is coerced to before it reaches the store
+_RECORD_TYPES = {
+    field.name: str if pa.types.is_string(field.type) else int if pa.types.is_integer(field.type) else float
+    for field in RECORD_SCHEMA
+}
+
+def normalize_record(record: Dict, strict: bool = True, context: str = "") -> Dict:
+    """Coerce a transaction to RECORD_SCHEMA types, rejecting (strict) or dropping fields the store cannot hold"""
+    unknown = set(record) - set(_RECORD_TYPES)
+    if unknown:
+        if strict:
+            raise ValueError(f"Unknown transaction field(s): {', '.join(sorted(unknown))}")
+        logger.warning("%sdropping unknown transaction field(s): %s", context, ", ".join(sorted(unknown)))
+    
+    normalized = {}
+    for name, value in record.items():
+        if name in unknown:
+            continue
+        if value is None:
+            normalized[name] = None
+            continue
+        try:
+            normalized[name] = _RECORD_TYPES[name](value)
+        except (TypeError, ValueError):
+            if strict:
+                raise ValueError(f"Transaction field {name!r} has invalid value {value!r}") from None
+            logger.warning("%sdropping invalid value %r for transaction field %r", context, value, name)
+            normalized[name] = None
+    return normalized
+
+# Interest rule shared by the scalar and batch calculations
+BULK_RECOVERY_THRESHOLD = 100000  # 1 Lakh
+HIGH_INTEREST_RATE = 10.8
+STANDARD_INTEREST_RATE = 8.5
+
+def _round_amount(amount: float) -> float:
+    """Round an interest amount to paise; the one rounding rule for every path"""
+    # Python's round is correctly rounded on the decimal value; np.round (which
+    # round() dispatches to for numpy scalars) is not, so always round a plain float
+    return round(float(amount), 2)
+
+@functools.lru_cache(maxsize=4096)
+def _calc_interest(recovery_amount: float, days_held: int, has_receipt: bool) -> tuple:
+    """Memoized scalar interest rule, returns (rate, amount, transaction type)"""
+    # Determine interest rate and transaction type
+    interest_rate = HIGH_INTEREST_RATE if recovery_amount >= BULK_RECOVERY_THRESHOLD else STANDARD_INTEREST_RATE
+    transaction_type = "Bulk" if has_receipt else "Monthly"
+    
+    # Calculate simple interest: (Recovery * InterestRate * DaysHeld) / 36500
+    interest_amount = (recovery_amount * interest_rate * days_held) / 36500
+    
+    return interest_rate, _round_amount(interest_amount), transaction_type
+
 class ThriftManager:
-    def __init__(self, data_file="mock_thrift_data.json"):
+    def __init__(self, data_file="mock_thrift_data.json",
+                 members_file="thrift_members.json",
+                 transactions_file="thrift_transactions.parquet",
+                 journal_file="thrift_data.log.jsonl"):
         self.data_file = data_file
-        self.data = self.load_data()
+        self.members_file = members_file
+        self.transactions_file = transactions_file
+        self.journal_file = journal_file
+        self._lock = threading.RLock()
+        self._scan_rows = []
+        self._scan_ids = []
+        self._search_array = None
+        self._instance_id = uuid.uuid4().hex
+        self._mutation_counter = 0
+        self._generation = 0
+        self._journal_seq = 0
+        # Journaled transactions not yet folded into the committed Parquet generation
+        self._pending_rows = []
+        
+        if os.path.exists(self.members_file):
+            self.data = self.load_store()
+            self._dirty = False
+        else:
+            # First run: seed the working store from the JSON data file
+            self.data = self.load_data()
+            self._dirty = True
+        self._journal_size = self._replay_journal()
+        self.flush()
+        self.reindex()
+    
+    def _transactions_path(self, generation: int) -> str:
+        """Parquet file holding the transactions of one store generation"""
+        root, ext = os.path.splitext(self.transactions_file)
+        return f"{root}.{generation}{ext}"
+    
+    def load_store(self) -> Dict:
+        """Load data from the member header JSON and the transactions Parquet table"""
+        with open(self.members_file, 'rb') as f:
+            store = orjson.loads(f.read())
+        
+        # The members file names the Parquet generation it was committed with and
+        # the last journal entry already folded into it
+        self._generation = store["Generation"]
+        self._journal_seq = store["JournalSeq"]
+        data = store["Members"]
+        for member_data in data.values():
+            member_data["ThriftRecords"] = []
+        
+        transactions_path = self._transactions_path(self._generation)
+        if os.path.exists(transactions_path):
+            for record in pq.read_table(transactions_path).to_pylist():
+                member_id = record.pop("MemberID")
+                if member_id in data:
+                    data[member_id]["ThriftRecords"].append(record)
+        
+        return data
+    
+    def _replay_journal(self) -> int:
+        """Apply journaled appends on top of the loaded data, returns the journal size in bytes"""
+        if not os.path.exists(self.journal_file):
+            return 0
+        
+        good_size = 0
+        with open(self.journal_file, 'r+b') as f:
+            for line in iter(f.readline, b""):
+                try:
+                    # A line without its newline was cut short even if it happens to parse
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated journal line")
+                    entry = orjson.loads(line)
+                except ValueError:
+                    # A torn final line from an interrupted append; cut it off so the
+                    # next append starts on a clean line instead of gluing onto it
+                    f.truncate(good_size)
+                    break
+                good_size += len(line)
+                if entry["seq"] <= self._journal_seq:
+                    # Already part of the snapshot; left behind by a flush interrupted before truncating
+                    continue
+                if entry["op"] == "add_txn" and entry["member_id"] in self.data:
+                    self.data[entry["member_id"]].setdefault("ThriftRecords", []).append(entry["txn"])
+                    self._pending_rows.append({**entry["txn"], "MemberID": entry["member_id"]})
+                self._journal_seq = entry["seq"]
+        
+        return good_size
+    
+    def _append_journal(self, entry: Dict):
+        """Append one operation to the journal instead of rewriting the store"""
+        with self._lock:
+            self._journal_seq += 1
+            line = orjson.dumps({"seq": self._journal_seq, **entry}, default=str) + b"\n"
+            with open(self.journal_file, 'ab') as f:
+                f.write(line)
+            self._journal_size += len(line)
+            self._mutation_counter += 1
+            if self._journal_size > JOURNAL_COMPACT_BYTES:
+                self.compact()
+    
+    def compact(self):
+        """Fold the journal into the working store and truncate it"""
+        with self._lock:
+            if self._journal_size:
+                self._dirty = True
+            self.flush()
     
     def load_data(self) -> Dict:
         """Load data from JSON file"""
         if os.path.exists(self.data_file):
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
+            with open(self.data_file, 'rb') as f:
+                data = orjson.loads(f.read())
                 # Ensure we always return a dictionary
                 if isinstance(data, dict):
+                    for member_id, member_data in data.items():
+                        self.normalize_member(member_id, member_data)
                     return data
                 else:
                     # If data is not a dict (e.g., a list), return empty dict
                     return {}
         return {}
     
+    @staticmethod
+    def normalize_member(member_id: str, member_data: Dict) -> Dict:
+        """Coerce a member's ThriftRecords in place so they fit the transactions table"""
+        # Existing data is loaded leniently; only add_transaction rejects bad records outright
+        member_data["ThriftRecords"] = [
+            normalize_record(t, strict=False, context=f"Member {member_id}: ")
+            for t in member_data.get("ThriftRecords", [])
+        ]
+        return member_data
+    
+    def members_snapshot(self) -> List[Tuple[str, Dict]]:
+        """Point-in-time (member_id, member_data) list, safe to iterate while other sessions write"""
+        with self._lock:
+            return list(self.data.items())
+    
+    def replace_data(self, data: Dict):
+        """Swap in a whole new member dict, e.g. after a bulk load or clear"""
+        with self._lock:
+            self.data = data
+            self.reindex()
+            self._mark_dirty()
+    
     def save_data(self):
-        """Save data to JSON file"""
-        with open(self.data_file, 'w') as f:
-            json.dump(self.data, f, indent=2, default=str)
+        """Schedule a save of the data file"""
+        self._mark_dirty()
+    
+    def _mark_dirty(self):
+        """Flag unsaved changes for the end-of-rerun flush"""
+        with self._lock:
+            self._dirty = True
+            self._mutation_counter += 1
+    
+    def flush(self):
+        """Write pending changes to the working store"""
+        with self._lock:
+            if not self._dirty:
+                return
+            
+            members = {
+                member_id: {key: value for key, value in member_data.items() if key != "ThriftRecords"}
+                for member_id, member_data in self.data.items()
+            }
+            
+            # Write the next generation's table under its own name; nothing reads it
+            # until the members file naming that generation replaces the old one
+            generation = self._generation + 1
+            pq.write_table(self._build_transactions_table(), self._transactions_path(generation))
+            
+            tmp_file = f"{self.members_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    {"Generation": generation, "JournalSeq": self._journal_seq, "Members": members},
+                    option=orjson.OPT_INDENT_2, default=str
+                ))
+            os.replace(tmp_file, self.members_file)
+            
+            previous_path = self._transactions_path(self._generation)
+            self._generation = generation
+            self._dirty = False
+            self._pending_rows = []
+            if os.path.exists(previous_path):
+                os.remove(previous_path)
+            
+            # The store now holds every journaled transaction up to JournalSeq
+            if self._journal_size:
+                open(self.journal_file, 'wb').close()
+                self._journal_size = 0
+    
+    def _build_transactions_table(self) -> pa.Table:
+        """Flatten every member's ThriftRecords into one Arrow table"""
+        rows = [
+            {**transaction, "MemberID": member_id}
+            for member_id, member_data in self.data.items()
+            for transaction in member_data.get("ThriftRecords", [])
+        ]
+        return pa.Table.from_pylist(rows, schema=TRANSACTION_SCHEMA)
+    
+    def fingerprint(self) -> tuple:
+        """Cheap key that changes whenever the data does"""
+        return (self._instance_id, len(self.data), self._mutation_counter)
+    
+    def transactions_table(self) -> pa.Table:
+        """All transactions as one Arrow table, read from the committed generation plus the journal"""
+        with self._lock:
+            committed_path = self._transactions_path(self._generation)
+            if self._dirty or not os.path.exists(committed_path):
+                # Unflushed edits may touch committed rows, so only memory is current
+                return self._build_transactions_table()
+            
+            committed = pq.read_table(committed_path)
+            if not self._pending_rows:
+                return committed
+            pending = pa.Table.from_pylist(self._pending_rows, schema=TRANSACTION_SCHEMA)
+            return pa.concat_tables([committed, pending])
+    
+    def export_csv(self) -> bytes:
+        """Export every transaction with its member's header fields as CSV"""
+        transactions = self.transactions_table()
+        if transactions.num_rows == 0:
+            return b""
+        
+        # Broadcast member-level fields onto transaction rows by position lookup
+        snapshot = self.members_snapshot()
+        member_ids = [member_id for member_id, _ in snapshot]
+        members = [member_data for _, member_data in snapshot]
+        member_index = pc.index_in(transactions["MemberID"], value_set=pa.array(member_ids, pa.string()))
+        member_columns = {
+            'MemberName': pa.array([m.get('MemberName', '') for m in members], pa.string()),
+            'MSNo': pa.array([str(m.get('MSNo', '')) for m in members], pa.string()),
+            'ShareCapital': pa.array([m.get('ShareCapital', 0) for m in members], pa.float64()),
+            'OpeningBalance': pa.array([m.get('OpeningBalance', {}).get('ThriftBalance', 0) for m in members], pa.float64()),
+        }
+        
+        columns = {'MemberID': transactions["MemberID"]}
+        columns.update({name: values.take(member_index) for name, values in member_columns.items()})
+        columns.update({name: transactions[name] for name in transactions.column_names if name != 'MemberID'})
+        
+        buf = io.BytesIO()
+        pa_csv.write_csv(pa.table(columns), buf)
+        return buf.getvalue()
     
     def calculate_interest(self, recovery_amount: float, days_held: int, has_receipt: bool) -> Dict:
         """Calculate interest based on business rules"""
+        interest_rate, interest_amount, transaction_type = _calc_interest(recovery_amount, days_held, has_receipt)
+        
+        return {
+            "InterestRate": interest_rate,
+            "InterestAmount": interest_amount,
+            "TransactionType": transaction_type,
+            "InterestBand": f"{interest_rate}%"
+        }
+    
+    def calculate_interest_batch(self, recovery: np.ndarray, days: np.ndarray, has_receipt: np.ndarray) -> Dict[str, np.ndarray]:
+        """Calculate interest for arrays of transactions in one vectorized pass"""
         # Determine interest rate and transaction type
-        if recovery_amount >= 100000:  # >= 1 Lakh
-            interest_rate = 10.8
-            transaction_type = "Bulk" if has_receipt else "Monthly"
-        else:  # < 1 Lakh
-            interest_rate = 8.5
-            transaction_type = "Bulk" if has_receipt else "Monthly"
+        interest_rate = np.where(recovery >= BULK_RECOVERY_THRESHOLD, HIGH_INTEREST_RATE, STANDARD_INTEREST_RATE)
+        transaction_type = np.where(has_receipt, "Bulk", "Monthly")
         
         # Calculate simple interest: (Recovery * InterestRate * DaysHeld) / 36500
-        interest_amount = (recovery_amount * interest_rate * days_held) / 36500
+        interest_amount = (recovery * interest_rate * days) / 36500
+        interest_amount = np.array([_round_amount(amount) for amount in interest_amount.tolist()], dtype=float)
         
         return {
             "InterestRate": interest_rate,
-            "InterestAmount": round(interest_amount, 2),
+            "InterestAmount": interest_amount,
             "TransactionType": transaction_type,
-            "InterestBand": f"{interest_rate}%"
+            "InterestBand": np.where(
+                interest_rate == HIGH_INTEREST_RATE,
+                f"{HIGH_INTEREST_RATE}%",
+                f"{STANDARD_INTEREST_RATE}%"
+            )
         }
     
+    def recompute_interest(self) -> int:
+        """Recalculate interest fields on every stored transaction"""
+        with self._lock:
+            records = [
+                transaction
+                for member_data in self.data.values()
+                for transaction in member_data.get("ThriftRecords", [])
+            ]
+            if not records:
+                return 0
+            
+            result = self.calculate_interest_batch(
+                np.array([t.get("Recovery", 0) for t in records], dtype=float),
+                np.array([t.get("DaysHeld", 0) for t in records], dtype=float),
+                np.array([bool(t.get("ReceiptNumber")) for t in records], dtype=bool)
+            )
+            columns = {key: values.tolist() for key, values in result.items()}
+            for i, transaction in enumerate(records):
+                for key, values in columns.items():
+                    transaction[key] = values[i]
+            
+            self._mark_dirty()
+            return len(records)
+    
     def add_member(self, member_id: str, member_data: Dict):
         """Add new member"""
-        self.data[member_id] = member_data
-        self.save_data()
+        self.normalize_member(member_id, member_data)
+        with self._lock:
+            self.data[member_id] = member_data
+            self._index_member(member_id)
+            self._mark_dirty()
     
     def get_member(self, member_id: str) -> Dict:
         """Get member data"""
@@ -69,34 +419,81 @@ class ThriftManager:
     
     def update_member(self, member_id: str, member_data: Dict):
         """Update member data"""
-        self.data[member_id] = member_data
-        self.save_data()
+        self.normalize_member(member_id, member_data)
+        with self._lock:
+            self.data[member_id] = member_data
+            self._index_member(member_id)
+            self._mark_dirty()
+    
+    @staticmethod
+    def _scan_row(member_id: str, member_data: Dict) -> tuple:
+        """Lowercased search fields for one member"""
+        return (
+            member_id.lower(),
+            member_data.get("MemberName", "").lower(),
+            str(member_data.get("MSNo", "")).lower(),
+            member_id
+        )
+    
+    def reindex(self):
+        """Rebuild the search rows from scratch after bulk data changes"""
+        self._scan_ids = sorted(self.data)
+        self._scan_rows = [self._scan_row(member_id, self.data[member_id]) for member_id in self._scan_ids]
+        self._search_array = None
+    
+    def _index_member(self, member_id: str):
+        """Insert or refresh one member's search row, keeping rows sorted by member ID"""
+        row = self._scan_row(member_id, self.data[member_id])
+        i = bisect.bisect_left(self._scan_ids, member_id)
+        if i < len(self._scan_ids) and self._scan_ids[i] == member_id:
+            self._scan_rows[i] = row
+        else:
+            self._scan_ids.insert(i, member_id)
+            self._scan_rows.insert(i, row)
+        self._search_array = None
     
-    def search_members(self, search_term: str) -> List[Dict]:
+    def search_members(self, search_term: str) -> List[Tuple[str, Dict]]:
         """Search members by ID, Name, or MS No"""
-        results = []
         search_term = search_term.lower()
         
-        for member_id, member_data in self.data.items():
-            if (search_term in member_id.lower() or 
-                search_term in member_data.get("MemberName", "").lower() or
-                search_term in str(member_data.get("MSNo", "")).lower()):
-                results.append({**member_data, "MemberID": member_id})
-        
-        return results
+        with self._lock:
+            if len(self._scan_rows) > NUMPY_SEARCH_THRESHOLD:
+                if self._search_array is None:
+                    # Fields are joined with NUL so a search term cannot match across two fields
+                    self._search_array = np.array(["\0".join(row[:3]) for row in self._scan_rows])
+                hits = np.flatnonzero(np.char.find(self._search_array, search_term) >= 0)
+                matches = [self._scan_ids[i] for i in hits]
+            else:
+                matches = [
+                    member_id for lc_id, lc_name, lc_msno, member_id in self._scan_rows
+                    if search_term in lc_id or search_term in lc_name or search_term in lc_msno
+                ]
+            
+            return [(member_id, self.data[member_id]) for member_id in matches]
     
     def add_transaction(self, member_id: str, transaction: Dict):
         """Add transaction to member"""
-        if member_id not in self.data:
-            return False
+        transaction = normalize_record(transaction)
         
-        if "ThriftRecords" not in self.data[member_id]:
-            self.data[member_id]["ThriftRecords"] = []
-        
-        self.data[member_id]["ThriftRecords"].append(transaction)
-        self.save_data()
+        # Append and journal together so a flush can never land between the two
+        with self._lock:
+            if member_id not in self.data:
+                return False
+            
+            if "ThriftRecords" not in self.data[member_id]:
+                self.data[member_id]["ThriftRecords"] = []
+            
+            self.data[member_id]["ThriftRecords"].append(transaction)
+            self._pending_rows.append({**transaction, "MemberID": member_id})
+            self._append_journal({"op": "add_txn", "member_id": member_id, "txn": transaction})
         return True
 
+@functools.lru_cache(maxsize=4)
+def _load_mock_cached(path: str, mtime: float) -> List[Dict]:
+    """Parse a mock data file once per modification time"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
 def load_mock_data(manager: ThriftManager):
     """Load comprehensive mock data from JSON file"""
     mock_data_file = "attached_assets/mock_thrift_data_1754567673631.json"
@@ -104,16 +501,18 @@ def load_mock_data(manager: ThriftManager):
     try:
         # Only load if no data exists to avoid overwriting user data
         if not manager.data:
-            with open(mock_data_file, 'r') as f:
-                mock_data_list = json.load(f)
+            mock_data = _load_mock_cached(mock_data_file, os.path.getmtime(mock_data_file))
+            # Round-trip through orjson for a private copy the manager is free to mutate
+            mock_data_list = orjson.loads(orjson.dumps(mock_data))
             
-            # Convert list format to dictionary format for our data structure
+            # Convert list format to dictionary format for our data structure; build it
+            # aside so a failure part-way leaves the manager untouched
+            members = {}
             for member in mock_data_list:
-                member_copy = member.copy()  # Create a copy to avoid modifying original
-                member_id = member_copy.pop("MemberID")  # Remove MemberID from member data
-                manager.data[member_id] = member_copy
+                member_id = member.pop("MemberID")  # Remove MemberID from member data
+                members[member_id] = manager.normalize_member(member_id, member)
             
-            manager.save_data()
+            manager.replace_data(members)
             st.sidebar.success(f"✅ Loaded {len(mock_data_list)} members with mock data")
     except FileNotFoundError:
         # Fallback to basic sample data if mock file not found
@@ -151,12 +550,18 @@ def init_basic_sample_data(manager: ThriftManager):
     if "1070135" not in manager.data:
         manager.add_member("1070135", sample_member)
 
+@st.cache_resource
+def get_manager() -> ThriftManager:
+    """Build the manager once and share it across reruns and sessions"""
+    return ThriftManager()
+
 def main():
     st.title("🏦 Thrift Savings Management System")
     st.markdown("---")
     
-    # Initialize manager
-    manager = ThriftManager()
+    # Initialize manager; the mock load is a no-op once data exists, and runs
+    # outside the cached function so its sidebar messages aren't replayed
+    manager = get_manager()
     load_mock_data(manager)
     
     # Sidebar navigation
@@ -166,16 +571,20 @@ def main():
         ["🔍 Search & View", "➕ Add Member", "📊 Add Transaction", "📈 Analytics", "📂 Data Management"]
     )
     
-    if page == "🔍 Search & View":
-        search_and_view_page(manager)
-    elif page == "➕ Add Member":
-        add_member_page(manager)
-    elif page == "📊 Add Transaction":
-        add_transaction_page(manager)
-    elif page == "📈 Analytics":
-        analytics_page(manager)
-    elif page == "📂 Data Management":
-        data_management_page(manager)
+    try:
+        if page == "🔍 Search & View":
+            search_and_view_page(manager)
+        elif page == "➕ Add Member":
+            add_member_page(manager)
+        elif page == "📊 Add Transaction":
+            add_transaction_page(manager)
+        elif page == "📈 Analytics":
+            analytics_page(manager)
+        elif page == "📂 Data Management":
+            data_management_page(manager)
+    finally:
+        # Persist whatever this rerun changed, including runs cut short by st.rerun()
+        manager.flush()
 
 def search_and_view_page(manager: ThriftManager):
     st.header("🔍 Search & View Members")
@@ -194,36 +603,44 @@ def search_and_view_page(manager: ThriftManager):
             st.success(f"Found {len(results)} member(s)")
             
             # Display search results
-            for member in results:
-                with st.expander(f"👤 {member['MemberName']} (ID: {member['MemberID']})"):
-                    display_member_details(member, manager)
+            for member_id, member_data in results:
+                with st.expander(f"👤 {member_data['MemberName']} (ID: {member_id})"):
+                    display_member_details(member_id, member_data, manager)
         else:
             st.warning("No members found matching your search criteria.")
     
     # Show all members if no search
     if not search_term:
         st.subheader("All Members")
-        if manager.data:
-            for member_id, member_data in manager.data.items():
+        members = manager.members_snapshot()
+        if members:
+            for member_id, member_data in members:
                 with st.expander(f"👤 {member_data['MemberName']} (ID: {member_id})"):
-                    display_member_details({**member_data, "MemberID": member_id}, manager)
+                    display_member_details(member_id, member_data, manager)
         else:
             st.info("No members found. Add some members to get started.")
 
-def display_member_details(member: Dict, manager: ThriftManager):
+def records_frame(transactions: List[Dict]) -> pd.DataFrame:
+    """Arrow-backed frame of a member's ThriftRecords with missing receipts filled"""
+    # Stored records are normalized on load and on add, so they always fit the schema
+    df = pa.Table.from_pylist(transactions, schema=RECORD_SCHEMA).to_pandas(types_mapper=pd.ArrowDtype)
+    df['ReceiptNumber'] = df['ReceiptNumber'].fillna('—')
+    return df
+
+def display_member_details(member_id: str, member_data: Dict, manager: ThriftManager):
     """Display detailed member information"""
     
     # Member basic info
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Member ID", member['MemberID'])
+        st.metric("Member ID", member_id)
     with col2:
-        st.metric("MS No", member.get('MSNo', 'N/A'))
+        st.metric("MS No", member_data.get('MSNo', 'N/A'))
     with col3:
-        st.metric("Share Capital", f"₹{member.get('ShareCapital', 0):,}")
+        st.metric("Share Capital", f"₹{member_data.get('ShareCapital', 0):,}")
     
     # Opening balance
-    opening_balance = member.get('OpeningBalance', {})
+    opening_balance = member_data.get('OpeningBalance', {})
     st.subheader("Opening Balance")
     col1, col2 = st.columns(2)
     with col1:
@@ -232,67 +649,62 @@ def display_member_details(member: Dict, manager: ThriftManager):
         st.metric("Thrift Balance", f"₹{opening_balance.get('ThriftBalance', 0):,}")
     
     # Transactions
-    transactions = member.get('ThriftRecords', [])
+    transactions = member_data.get('ThriftRecords', [])
     if transactions:
         st.subheader("Transactions")
         
+        # Build an Arrow-backed frame once and split it by interest rate in a single pass
+        df = records_frame(transactions)
+        groups = dict(tuple(df.groupby('InterestRate')))
+        
         # Filter tabs
         tab1, tab2, tab3 = st.tabs(["All Transactions", "10.8% Transactions", "8.5% Transactions"])
         
         with tab1:
-            display_transaction_table(transactions, "all")
+            display_transaction_table(df, "all")
         
         with tab2:
-            filtered_108 = [t for t in transactions if t.get('InterestRate') == 10.8]
-            display_transaction_table(filtered_108, "10.8%")
+            display_transaction_table(groups.get(10.8, df.iloc[:0]), "10.8%")
         
         with tab3:
-            filtered_85 = [t for t in transactions if t.get('InterestRate') == 8.5]
-            display_transaction_table(filtered_85, "8.5%")
+            display_transaction_table(groups.get(8.5, df.iloc[:0]), "8.5%")
         
         # Summary panel
-        display_summary_panel(member)
+        display_summary_panel(member_data, df)
     else:
         st.info("No transactions found for this member.")
 
-def display_transaction_table(transactions: List[Dict], filter_type: str):
+def display_transaction_table(df: pd.DataFrame, filter_type: str):
     """Display transaction table"""
-    if not transactions:
+    if df.empty:
         st.info(f"No {filter_type} transactions found.")
         return
     
-    # Convert to DataFrame for better display
-    df = pd.DataFrame(transactions)
+    # Reorder columns
+    column_order = ['Date', 'Recovery', 'TransactionType', 'ReceiptNumber', 'InterestRate', 'DaysHeld', 'InterestAmount']
+    df_display = df[[col for col in column_order if col in df.columns]]
     
-    # Format columns
-    if not df.empty:
-        # Format currency columns
-        for col in ['Recovery', 'Paid', 'Balance', 'InterestAmount']:
-            if col in df.columns:
-                df[col] = df[col].apply(lambda x: f"₹{x:,.2f}" if pd.notnull(x) else "₹0.00")
-        
-        # Format receipt number
-        if 'ReceiptNumber' in df.columns:
-            df['ReceiptNumber'] = df['ReceiptNumber'].fillna('—')
-        
-        # Reorder columns
-        column_order = ['Date', 'Recovery', 'TransactionType', 'ReceiptNumber', 'InterestRate', 'DaysHeld', 'InterestAmount']
-        df_display = df[[col for col in column_order if col in df.columns]]
-        
-        st.dataframe(df_display, use_container_width=True)
+    # Format currency columns in the Styler so the frame keeps its numeric dtypes
+    currency_columns = [col for col in ['Recovery', 'Paid', 'Balance', 'InterestAmount'] if col in df_display.columns]
+    styled = (
+        df_display.style
+        .format(_CURRENCY, subset=currency_columns, na_rep=_CURRENCY(0))
+        .format("{:g}", subset=['InterestRate'])
+    )
+    
+    st.dataframe(styled, use_container_width=True)
 
-def display_summary_panel(member: Dict):
+def display_summary_panel(member: Dict, df: pd.DataFrame):
     """Display summary panel"""
     st.subheader("📊 Summary")
     
-    transactions = member.get('ThriftRecords', [])
-    if not transactions:
+    if df.empty:
         return
     
     # Calculate totals
-    total_recovery = sum(t.get('Recovery', 0) for t in transactions)
-    interest_108 = sum(t.get('InterestAmount', 0) for t in transactions if t.get('InterestRate') == 10.8)
-    interest_85 = sum(t.get('InterestAmount', 0) for t in transactions if t.get('InterestRate') == 8.5)
+    total_recovery = df['Recovery'].sum()
+    interest_108 = df.loc[df['InterestRate'].eq(10.8), 'InterestAmount'].sum()
+    interest_85 = df.loc[df['InterestRate'].eq(8.5), 'InterestAmount'].sum()
     grand_interest = interest_108 + interest_85
     
     opening_balance = member.get('OpeningBalance', {}).get('ThriftBalance', 0)
@@ -302,15 +714,15 @@ def display_summary_panel(member: Dict):
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        st.metric("Total Recovery", f"₹{total_recovery:,.2f}")
+        st.metric("Total Recovery", _CURRENCY(total_recovery))
     with col2:
-        st.metric("Interest (10.8%)", f"₹{interest_108:,.2f}")
+        st.metric("Interest (10.8%)", _CURRENCY(interest_108))
     with col3:
-        st.metric("Interest (8.5%)", f"₹{interest_85:,.2f}")
+        st.metric("Interest (8.5%)", _CURRENCY(interest_85))
     with col4:
-        st.metric("Grand Interest", f"₹{grand_interest:,.2f}")
+        st.metric("Grand Interest", _CURRENCY(grand_interest))
     with col5:
-        st.metric("Final Balance", f"₹{final_balance:,.2f}")
+        st.metric("Final Balance", _CURRENCY(final_balance))
 
 def add_member_page(manager: ThriftManager):
     st.header("➕ Add New Member")
@@ -359,11 +771,11 @@ def add_transaction_page(manager: ThriftManager):
         return
     
     # Select member
-    member_options = [(f"{data['MemberName']} ({mid})", mid) for mid, data in manager.data.items()]
+    member_label = {mid: f"{data['MemberName']} ({mid})" for mid, data in manager.members_snapshot()}
     selected_member = st.selectbox(
         "Select Member",
-        options=[option[1] for option in member_options],
-        format_func=lambda x: next(option[0] for option in member_options if option[1] == x)
+        options=list(member_label),
+        format_func=member_label.get
     )
     
     if selected_member:
@@ -411,7 +823,7 @@ def add_transaction_page(manager: ThriftManager):
                         with col1:
                             st.metric("Interest Rate", f"{interest_calc['InterestRate']}%")
                         with col2:
-                            st.metric("Interest Amount", f"₹{interest_calc['InterestAmount']:,.2f}")
+                            st.metric("Interest Amount", _CURRENCY(interest_calc['InterestAmount']))
                         with col3:
                             st.metric("Transaction Type", interest_calc['TransactionType'])
                         
@@ -419,16 +831,44 @@ def add_transaction_page(manager: ThriftManager):
                     else:
                         st.error("Failed to add transaction")
 
+def summarize_transactions(table: pa.Table, key: str, count_column: str) -> pd.DataFrame:
+    """Sum recovery and interest per key with Arrow's columnar group_by"""
+    summary = table.group_by(key).aggregate([
+        ("Recovery", "sum"),
+        ("InterestAmount", "sum"),
+        ("MemberID", "count")
+    ])
+    summary = summary.filter(pc.is_valid(summary[key]))
+    
+    # Convert to pandas only at the display boundary
+    df = summary.to_pandas().rename(columns={
+        'Recovery_sum': 'Recovery',
+        'InterestAmount_sum': 'InterestAmount',
+        'MemberID_count': count_column
+    })
+    return df.set_index(key).sort_index()[['Recovery', 'InterestAmount', count_column]]
+
+# Only the latest fingerprint is ever read, so older entries can be evicted right away
+@st.cache_data(max_entries=2)
+def build_analytics_summaries(fingerprint: tuple, _manager: ThriftManager) -> tuple:
+    """Aggregate the transactions table once per data change rather than once per rerun"""
+    table = _manager.transactions_table()
+    return (
+        summarize_transactions(table, 'InterestBand', 'TransactionCount'),
+        summarize_transactions(table, 'TransactionType', 'Count')
+    )
+
 def analytics_page(manager: ThriftManager):
     st.header("📈 Analytics Dashboard")
     
-    if not manager.data:
+    members = manager.members_snapshot()
+    if not members:
         st.warning("No data available for analytics.")
         return
     
     # Overall statistics
-    total_members = len(manager.data)
-    total_transactions = sum(len(member.get('ThriftRecords', [])) for member in manager.data.values())
+    total_members = len(members)
+    total_transactions = sum(len(member.get('ThriftRecords', [])) for _, member in members)
     
     col1, col2 = st.columns(2)
     with col1:
@@ -441,31 +881,17 @@ def analytics_page(manager: ThriftManager):
         return
     
     # Aggregate data
-    all_transactions = []
-    for member_id, member_data in manager.data.items():
-        for transaction in member_data.get('ThriftRecords', []):
-            all_transactions.append({
-                **transaction,
-                'MemberID': member_id,
-                'MemberName': member_data.get('MemberName', '')
-            })
-    
-    df = pd.DataFrame(all_transactions)
+    interest_summary, type_summary = build_analytics_summaries(manager.fingerprint(), manager)
     
-    if not df.empty:
+    if not interest_summary.empty:
         # Interest band analysis
         st.subheader("Interest Band Analysis")
-        interest_summary = df.groupby('InterestBand').agg({
-            'Recovery': 'sum',
-            'InterestAmount': 'sum',
-            'MemberID': 'count'
-        }).rename(columns={'MemberID': 'TransactionCount'})
         
         col1, col2 = st.columns(2)
         with col1:
             st.dataframe(interest_summary.style.format({
-                'Recovery': '₹{:,.2f}',
-                'InterestAmount': '₹{:,.2f}'
+                'Recovery': _CURRENCY,
+                'InterestAmount': _CURRENCY
             }))
         
         with col2:
@@ -474,40 +900,36 @@ def analytics_page(manager: ThriftManager):
             for band in interest_summary.index:
                 st.metric(
                     f"{band} Band",
-                    f"₹{interest_summary.loc[band, 'InterestAmount']:,.2f}",
+                    _CURRENCY(interest_summary.loc[band, 'InterestAmount']),
                     f"{interest_summary.loc[band, 'TransactionCount']} transactions"
                 )
         
         # Transaction type analysis
         st.subheader("Transaction Type Distribution")
-        type_summary = df.groupby('TransactionType').agg({
-            'Recovery': 'sum',
-            'InterestAmount': 'sum',
-            'MemberID': 'count'
-        }).rename(columns={'MemberID': 'Count'})
-        
         st.dataframe(type_summary.style.format({
-            'Recovery': '₹{:,.2f}',
-            'InterestAmount': '₹{:,.2f}'
+            'Recovery': _CURRENCY,
+            'InterestAmount': _CURRENCY
         }))
 
 def data_management_page(manager: ThriftManager):
     st.header("📂 Data Management")
     
+    members = manager.members_snapshot()
+    
     # Current data status
     st.subheader("Current Data Status")
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        total_members = len(manager.data)
+        total_members = len(members)
         st.metric("Total Members", total_members)
     
     with col2:
-        total_transactions = sum(len(member.get('ThriftRecords', [])) for member in manager.data.values())
+        total_transactions = sum(len(member.get('ThriftRecords', [])) for _, member in members)
         st.metric("Total Transactions", total_transactions)
     
     with col3:
-        data_file_exists = os.path.exists(manager.data_file)
+        data_file_exists = os.path.exists(manager.members_file)
         st.metric("Data File Status", "✅ Exists" if data_file_exists else "❌ Missing")
     
     st.markdown("---")
@@ -521,9 +943,11 @@ def data_management_page(manager: ThriftManager):
         
         if st.button("🔄 Reload Mock Data", type="secondary"):
             # Clear existing data
-            manager.data = {}
+            manager.replace_data({})
             # Reload mock data
             load_mock_data(manager)
+            manager.flush()
+            get_manager.clear()
             st.success("Mock data reloaded successfully!")
             st.rerun()
     
@@ -532,25 +956,36 @@ def data_management_page(manager: ThriftManager):
         st.warning("This will permanently delete all current data!")
         
         if st.button("🗑️ Clear All Data", type="secondary"):
-            manager.data = {}
-            manager.save_data()
+            manager.replace_data({})
+            manager.flush()
+            get_manager.clear()
             st.success("All data cleared!")
             st.rerun()
     
     st.markdown("---")
     
+    # Interest maintenance
+    st.subheader("🧮 Recompute Interest")
+    st.info("This will recalculate interest rate, amount, type and band on every transaction using the current rules.")
+    
+    if st.button("🧮 Recompute All Interest", type="secondary"):
+        updated = manager.recompute_interest()
+        st.success(f"Recomputed interest on {updated} transaction(s)!")
+    
+    st.markdown("---")
+    
     # Export functionality
     st.subheader("📤 Export Data")
-    if manager.data:
+    if members:
         # Convert data to exportable format
         export_data = []
-        for member_id, member_data in manager.data.items():
+        for member_id, member_data in members:
             export_data.append({
                 "MemberID": member_id,
                 **member_data
             })
         
-        export_json = json.dumps(export_data, indent=2, default=str)
+        export_json = orjson.dumps(export_data, option=orjson.OPT_INDENT_2, default=str)
         
         col1, col2 = st.columns(2)
         with col1:
@@ -563,25 +998,12 @@ def data_management_page(manager: ThriftManager):
         
         with col2:
             # Convert to CSV for easier viewing
-            csv_data = []
-            for member_id, member_data in manager.data.items():
-                for transaction in member_data.get('ThriftRecords', []):
-                    csv_data.append({
-                        'MemberID': member_id,
-                        'MemberName': member_data.get('MemberName', ''),
-                        'MSNo': member_data.get('MSNo', ''),
-                        'ShareCapital': member_data.get('ShareCapital', 0),
-                        'OpeningBalance': member_data.get('OpeningBalance', {}).get('ThriftBalance', 0),
-                        **transaction
-                    })
+            csv_bytes = manager.export_csv()
             
-            if csv_data:
-                df_export = pd.DataFrame(csv_data)
-                csv_string = df_export.to_csv(index=False)
-                
+            if csv_bytes:
                 st.download_button(
                     label="📊 Download CSV",
-                    data=csv_string,
+                    data=csv_bytes,
                     file_name=f"thrift_transactions_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                     mime="text/csv"
                 )
@@ -589,11 +1011,11 @@ def data_management_page(manager: ThriftManager):
         st.info("No data available for export.")
     
     # Data preview
-    if manager.data:
+    if members:
         st.subheader("📋 Data Preview")
         st.write(f"Preview of current data structure (showing first 3 members):")
         
-        preview_data = dict(list(manager.data.items())[:3])
+        preview_data = dict(members[:3])
         st.json(preview_data)
 
 if __name__ == "__main__":
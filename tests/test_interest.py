@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+import app
+
+
+@pytest.fixture
+def manager():
+    # The interest methods never touch the store, so skip __init__
+    return app.ThriftManager.__new__(app.ThriftManager)
+
+
+def test_scalar_and_batch_round_the_same(manager):
+    rng = np.random.default_rng(0)
+    recovery = np.concatenate([[32047.0, 100000.0, 99999.99], rng.integers(1, 500000, 5000).astype(float)])
+    days = np.concatenate([[205.0, 30.0, 365.0], rng.integers(1, 400, 5000).astype(float)])
+    has_receipt = np.arange(len(recovery)) % 2 == 0
+    
+    batch = manager.calculate_interest_batch(recovery, days, has_receipt)
+    
+    for i in range(len(recovery)):
+        scalar = manager.calculate_interest(recovery[i], int(days[i]), bool(has_receipt[i]))
+        assert scalar["InterestAmount"] == batch["InterestAmount"][i]
+        assert scalar["InterestRate"] == batch["InterestRate"][i]
+        assert scalar["TransactionType"] == batch["TransactionType"][i]
+        assert scalar["InterestBand"] == batch["InterestBand"][i]
+
+
+def test_known_rounding_case(manager):
+    assert manager.calculate_interest(32047.0, 205, False)["InterestAmount"] == 1529.91
+    batch = manager.calculate_interest_batch(np.array([32047.0]), np.array([205.0]), np.array([False]))
+    assert batch["InterestAmount"][0] == 1529.91
@@ -0,0 +1,128 @@
+import builtins
+import os
+
+import orjson
+import pytest
+
+import app
+
+
+MEMBER_ID = "1070135"
+
+
+class Interrupted(Exception):
+    """Stands in for a crash part-way through a flush"""
+
+
+@pytest.fixture
+def make_manager(tmp_path):
+    seed = {
+        MEMBER_ID: {
+            "MemberName": "Ramu Parasinma",
+            "MSNo": "7036",
+            "ShareCapital": 800,
+            "OpeningBalance": {"Date": "2024-12-31", "ThriftBalance": 375463},
+            "ThriftRecords": [transaction(120000, "RCP123")],
+        }
+    }
+    (tmp_path / "seed.json").write_bytes(orjson.dumps(seed))
+    
+    def factory():
+        return app.ThriftManager(
+            data_file=str(tmp_path / "seed.json"),
+            members_file=str(tmp_path / "members.json"),
+            transactions_file=str(tmp_path / "transactions.parquet"),
+            journal_file=str(tmp_path / "journal.jsonl"),
+        )
+    return factory
+
+
+def transaction(recovery, receipt=None):
+    return {
+        "Date": "2025-01-14",
+        "Recovery": recovery,
+        "ReceiptNumber": receipt,
+        "Paid": 0,
+        "Balance": 0,
+        "DaysHeld": 30,
+        "InterestRate": 8.5,
+        "InterestAmount": 1.0,
+        "TransactionType": "Monthly",
+        "InterestBand": "8.5%",
+    }
+
+
+def record_count(manager):
+    return len(manager.data[MEMBER_ID]["ThriftRecords"])
+
+
+def test_journaled_transaction_survives_restart(make_manager):
+    manager = make_manager()
+    manager.add_transaction(MEMBER_ID, transaction(5000))
+    
+    assert record_count(make_manager()) == 2
+
+
+def test_torn_journal_tail_does_not_swallow_later_appends(make_manager):
+    manager = make_manager()
+    manager.add_transaction(MEMBER_ID, transaction(5000))
+    with open(manager.journal_file, "ab") as f:
+        f.write(b'{"seq":2,"op":"add_txn","member_id":"1070')
+    
+    manager = make_manager()
+    assert record_count(manager) == 2
+    manager.add_transaction(MEMBER_ID, transaction(6000))
+    manager.add_transaction(MEMBER_ID, transaction(7000))
+    assert record_count(manager) == 4
+    
+    assert record_count(make_manager()) == 4
+
+
+def test_flush_interrupted_before_members_commit_keeps_previous_snapshot(make_manager, monkeypatch):
+    manager = make_manager()
+    manager.add_transaction(MEMBER_ID, transaction(5000))
+    manager.add_member("2", {"MemberName": "New", "MSNo": "9", "ThriftRecords": []})
+    
+    real_replace = os.replace
+    def replace(src, dst):
+        if dst == manager.members_file:
+            raise Interrupted
+        return real_replace(src, dst)
+    monkeypatch.setattr(app.os, "replace", replace)
+    with pytest.raises(Interrupted):
+        manager.flush()
+    monkeypatch.undo()
+    
+    reloaded = make_manager()
+    assert record_count(reloaded) == 2
+    assert "2" not in reloaded.data
+
+
+def test_flush_interrupted_before_journal_truncate_does_not_duplicate(make_manager, monkeypatch):
+    manager = make_manager()
+    manager.add_transaction(MEMBER_ID, transaction(5000))
+    manager.update_member(MEMBER_ID, manager.data[MEMBER_ID])
+    
+    def open_(path, mode="r", *args, **kwargs):
+        if path == manager.journal_file and mode == "wb":
+            raise Interrupted
+        return builtins.open(path, mode, *args, **kwargs)
+    monkeypatch.setattr(app, "open", open_, raising=False)
+    with pytest.raises(Interrupted):
+        manager.flush()
+    monkeypatch.undo()
+    
+    assert os.path.getsize(manager.journal_file) > 0
+    assert record_count(make_manager()) == 2
+
+
+def test_transactions_table_includes_journaled_rows(make_manager):
+    manager = make_manager()
+    manager.add_transaction(MEMBER_ID, transaction(5000, "RCP9"))
+    
+    table = manager.transactions_table()
+    assert table.schema.equals(app.TRANSACTION_SCHEMA)
+    assert table.column("Recovery").to_pylist() == [120000, 5000]
+    assert table.equals(manager._build_transactions_table())
+    
+    assert make_manager().transactions_table().equals(table)